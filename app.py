@@ -28,16 +28,45 @@ from tkinter import scrolledtext, ttk
 import serial
 import threading
 import time
+import functools
+from collections import deque
 from datetime import datetime
 
 # === Konfiguration ===
 COM_PORT = 'COM7'        # Serielle Schnittstelle zum Arduino
 BAUD_RATE = 9600         # Übertragungsgeschwindigkeit
+DEBUG_LOG = False        # Ausführliche Debug-Ausgaben auf der Konsole
+MAX_LINES = 2000         # Maximale Zeilenzahl in der Ausgabe-Textbox (älteste werden verworfen)
+
+# === Datenmodell ===
+class ProjectState:
+    """
+    Zustand eines einzelnen Projekts.
+    
+    Attribute:
+        start_time (float | None): Startzeitpunkt der laufenden Session (time.monotonic())
+        total_time (float): Akkumulierte Zeit abgeschlossener Sessions in Sekunden
+        is_running (bool): True, wenn das Projekt gerade läuft
+    """
+    __slots__ = ('start_time', 'total_time', 'is_running')
+    
+    def __init__(self):
+        self.start_time = None
+        self.total_time = 0.0
+        self.is_running = False
 
 # === Globale Variablen ===
 ser = None               # Serielle Verbindung
 running = True           # Flag für Thread-Kontrolle
-projects = {}            # Projekt-Dictionary: {name: {'start_time': timestamp, 'total_time': seconds, 'is_running': bool}}
+projects = {}            # Projekt-Dictionary: {name: ProjectState}
+_tree_items = {}         # Treeview-Zuordnung: {name: item_id}
+_last_row = {}           # Zuletzt geschriebene Zeilenwerte: {name: (name, status, gesamt, session)}
+_cached_now = [0.0]      # Zeitstempel des aktuellen Timer-Ticks (einmal pro Tick gesetzt)
+_active = [None]         # Name des aktuell laufenden Projekts (höchstens eines) oder None
+_out_lines = [0]         # Anzahl Zeilen in der Ausgabe-Textbox
+_pending = deque()       # Noch nicht ausgegebene serielle Zeilen
+_flush_scheduled = [False]  # Ausgabe der wartenden Zeilen bereits eingeplant
+_snap = [None]           # Gecachtes tuple(projects.items()), None = ungültig (nach Hinzufügen/Löschen)
 
 # === GUI-Setup ===
 root = tk.Tk()
@@ -62,13 +91,20 @@ left_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
 # Ausgabe-Textbox
 output_box = scrolledtext.ScrolledText(left_frame, width=50, height=20, state='disabled', wrap='word')
 output_box.grid(row=0, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
+# Gebundene Methoden einmalig auflösen (werden pro serieller Zeile aufgerufen)
+_ob_configure = output_box.configure
+_ob_insert = output_box.insert
+_ob_see = output_box.see
+_ob_delete = output_box.delete
 
 # Aktuelle UID
-uid_label = tk.Label(left_frame, text="UID: ", anchor="w")
+_uid_var = tk.StringVar(value="UID: ")
+uid_label = tk.Label(left_frame, textvariable=_uid_var, anchor="w")
 uid_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
 
 # Aktueller Projektname
-project_label = tk.Label(left_frame, text="Projektname: ", anchor="w")
+_project_var = tk.StringVar(value="Projektname: ")
+project_label = tk.Label(left_frame, textvariable=_project_var, anchor="w")
 project_label.grid(row=2, column=0, sticky="w", padx=5, pady=2)
 
 # Eingabefeld + Button
@@ -141,11 +177,24 @@ def format_time(seconds):
     Returns:
         str: Formatierte Zeit als "HH:MM:SS"
     """
-    if seconds < 0:
-        return "00:00:00"
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_time_int(max(0, int(seconds)))
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_int(seconds):
+    """
+    Gecachte Formatierung für ganze, nicht-negative Sekunden.
+    
+    Die Anzeige wird jede Sekunde mit denselben Werten neu berechnet,
+    daher sind die meisten Aufrufe Cache-Treffer.
+    
+    Args:
+        seconds (int): Zeit in ganzen Sekunden (>= 0)
+        
+    Returns:
+        str: Formatierte Zeit als "HH:MM:SS"
+    """
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 def clean_project_name(project_name):
@@ -161,9 +210,8 @@ def clean_project_name(project_name):
     Returns:
         str: Bereinigter Projektname ohne UID
     """
-    if " (UID: " in project_name:
-        return project_name.split(" (UID: ")[0]
-    return project_name
+    i = project_name.find(" (UID: ")
+    return project_name if i == -1 else project_name[:i]
 
 def update_project_display():
     """
@@ -174,37 +222,49 @@ def update_project_display():
     - Gesamtzeit (inklusive aktueller Session)
     - Aktuelle Session-Zeit
     
-    Wird regelmäßig vom Timer aufgerufen für Live-Updates.
+    Wird regelmäßig vom Timer aufgerufen für Live-Updates. Bestehende Zeilen
+    werden nur neu geschrieben, wenn sich ihre Werte geändert haben.
+    
+    Verwendet den in _cached_now hinterlegten Zeitstempel, damit alle Zeilen
+    mit derselben Uhrzeit berechnet werden.
     """
-    # Alle Items löschen
-    for item in project_tree.get_children():
-        project_tree.delete(item)
+    current_time = _cached_now[0]
     
-    current_time = time.time()
+    # Momentaufnahme, damit Änderungen an projects die Iteration nicht stören;
+    # wird nur nach Hinzufügen/Löschen von Projekten neu erstellt
+    snapshot = _snap[0]
+    if snapshot is None:
+        snapshot = _snap[0] = tuple(projects.items())
     
-    # Projekte hinzufügen
-    for project_name, data in projects.items():
-        status = "Läuft" if data['is_running'] else "Pausiert"
+    # Projekte einfügen bzw. nur geänderte Zeilen aktualisieren
+    for project_name, data in snapshot:
+        status = "Läuft" if data.is_running else "Pausiert"
         
-        # Gesamtzeit berechnen
-        total_time = data['total_time']
-        if data['is_running'] and data['start_time'] is not None:
-            # Aktuelle Session zur Gesamtzeit hinzufügen
-            current_session_duration = current_time - data['start_time']
-            total_display_time = total_time + current_session_duration
+        # Aktuelle Session-Zeit berechnen
+        if data.is_running and data.start_time is not None:
+            current_session = current_time - data.start_time
         else:
-            total_display_time = total_time
+            current_session = 0
         
-        total_time_str = format_time(total_display_time)
+        # Auf ganze Sekunden kürzen (Anzeige im Sekundentakt), Gesamtzeit inkl. Session
+        total_int = int(data.total_time + current_session)
+        session_int = int(current_session)
         
-        # Aktuelle Session-Zeit berechnen
-        if data['is_running'] and data['start_time'] is not None:
-            current_session = current_time - data['start_time']
-            session_time = format_time(current_session)
-        else:
-            session_time = "00:00:00"
+        total_time_str = format_time(total_int)
+        session_time = format_time(session_int)
         
-        project_tree.insert("", "end", values=(project_name, status, total_time_str, session_time))
+        row = (project_name, status, total_time_str, session_time)
+        last = _last_row.get(project_name)
+        if last is None:
+            _tree_items[project_name] = project_tree.insert("", "end", values=row)
+        elif last != row:
+            project_tree.item(_tree_items[project_name], values=row)
+        _last_row[project_name] = row
+    
+    # Gelöschte Projekte aus der Anzeige entfernen
+    for project_name in [name for name in _tree_items if name not in projects]:
+        project_tree.delete(_tree_items.pop(project_name))
+        del _last_row[project_name]
 
 def add_or_update_project(project_name, action):
     """
@@ -220,78 +280,85 @@ def add_or_update_project(project_name, action):
         project_name (str): Name des Projekts (wird bereinigt)
         action (str): Aktion ("hinzugefügt", "gestartet", "pausiert", "geloescht")
     """
-    current_time = time.time()
+    current_time = time.monotonic()
     
     # Projektname bereinigen (UID entfernen falls vorhanden)
     clean_name = clean_project_name(project_name)
     
     # Debug-Ausgabe
-    print(f"Action: {action} für Projekt: '{project_name}' -> bereinigt: '{clean_name}'")
+    if DEBUG_LOG:
+        print(f"Action: {action} für Projekt: '{project_name}' -> bereinigt: '{clean_name}'")
     
     if action == "hinzugefügt":
         if clean_name not in projects:
-            projects[clean_name] = {
-                'start_time': None,
-                'total_time': 0,
-                'is_running': False
-            }
+            projects[clean_name] = ProjectState()
+            _snap[0] = None
             print(f"Projekt {clean_name} hinzugefügt")
     
     elif action == "gestartet":
-        # Alle anderen Projekte pausieren
-        for proj_name, proj_data in projects.items():
-            if proj_data['is_running'] and proj_data['start_time'] is not None:
-                session_duration = current_time - proj_data['start_time']
-                proj_data['total_time'] += session_duration
-                proj_data['is_running'] = False
-                proj_data['start_time'] = None
-                print(f"Projekt {proj_name} automatisch pausiert (Session: {session_duration:.1f}s)")
+        # Bisher laufendes Projekt pausieren (es läuft höchstens eines)
+        proj_name = _active[0]
+        proj_data = projects.get(proj_name) if proj_name is not None else None
+        if proj_data is not None and proj_data.is_running and proj_data.start_time is not None:
+            session_duration = current_time - proj_data.start_time
+            proj_data.total_time += session_duration
+            proj_data.is_running = False
+            proj_data.start_time = None
+            print(f"Projekt {proj_name} automatisch pausiert (Session: {session_duration:.1f}s)")
         
         # Projekt erstellen falls es nicht existiert, dann starten
         if clean_name not in projects:
-            projects[clean_name] = {
-                'start_time': current_time,
-                'total_time': 0,
-                'is_running': True
-            }
+            state = ProjectState()
+            state.start_time = current_time
+            state.is_running = True
+            projects[clean_name] = state
+            _snap[0] = None
             print(f"Neues Projekt {clean_name} erstellt und gestartet")
         else:
-            projects[clean_name]['start_time'] = current_time
-            projects[clean_name]['is_running'] = True
-            print(f"Projekt {clean_name} gestartet um {current_time}")
+            projects[clean_name].start_time = current_time
+            projects[clean_name].is_running = True
+            print(f"Projekt {clean_name} gestartet um {datetime.now():%H:%M:%S}")
+        _active[0] = clean_name
     
     elif action == "pausiert":
-        if clean_name in projects and projects[clean_name]['is_running']:
-            if projects[clean_name]['start_time'] is not None:
-                session_duration = current_time - projects[clean_name]['start_time']
-                projects[clean_name]['total_time'] += session_duration
+        if clean_name in projects and projects[clean_name].is_running:
+            if projects[clean_name].start_time is not None:
+                session_duration = current_time - projects[clean_name].start_time
+                projects[clean_name].total_time += session_duration
                 print(f"Session von {session_duration:.1f} Sekunden zu {clean_name} hinzugefügt")
-            projects[clean_name]['is_running'] = False
-            projects[clean_name]['start_time'] = None
-            print(f"Projekt {clean_name} pausiert, Gesamtzeit: {projects[clean_name]['total_time']:.1f}s")
+            projects[clean_name].is_running = False
+            projects[clean_name].start_time = None
+            if _active[0] == clean_name:
+                _active[0] = None
+            print(f"Projekt {clean_name} pausiert, Gesamtzeit: {projects[clean_name].total_time:.1f}s")
     
     elif action == "geloescht":
         if clean_name in projects:
             # Wenn das Projekt läuft, erst stoppen und Zeit hinzufügen
-            if projects[clean_name]['is_running']:
-                if projects[clean_name]['start_time'] is not None:
-                    session_duration = current_time - projects[clean_name]['start_time']
-                    projects[clean_name]['total_time'] += session_duration
+            if projects[clean_name].is_running:
+                if projects[clean_name].start_time is not None:
+                    session_duration = current_time - projects[clean_name].start_time
+                    projects[clean_name].total_time += session_duration
                     print(f"Laufendes Projekt gestoppt beim Löschen: {session_duration:.1f}s hinzugefügt")
-                projects[clean_name]['is_running'] = False
-                projects[clean_name]['start_time'] = None
+                projects[clean_name].is_running = False
+                projects[clean_name].start_time = None
             
-            total_time = projects[clean_name]['total_time']
+            total_time = projects[clean_name].total_time
             del projects[clean_name]
+            _snap[0] = None
+            if _active[0] == clean_name:
+                _active[0] = None
             print(f"Projekt '{clean_name}' gelöscht (Gesamtzeit war: {format_time(total_time)})")
         else:
             print(f"Projekt '{clean_name}' zum Löschen nicht gefunden!")
     
     # Debug: Aktueller Zustand aller Projekte
-    print("Aktuelle Projekte:")
-    for name, data in projects.items():
-        print(f"  '{name}': running={data['is_running']}, total={data['total_time']:.1f}s, start={data['start_time']}")
+    if DEBUG_LOG:
+        print("Aktuelle Projekte:")
+        for name, data in projects.items():
+            print(f"  '{name}': running={data.is_running}, total={data.total_time:.1f}s, start={data.start_time}")
     
+    _cached_now[0] = current_time
     update_project_display()
 
 # === Timer für Live-Updates ===
@@ -303,11 +370,99 @@ def update_timer():
     - Laufende Projektzeiten zu aktualisieren
     - GUI-Anzeige zu refreshen
     
+    Die Anzeige wird nur neu berechnet, wenn ein Projekt läuft; Änderungen
+    durch Arduino-Events zeichnet add_or_update_project() sofort.
+    
     Verwendet root.after() für Thread-sichere GUI-Updates.
     """
-    update_project_display()  # Immer aktualisieren, nicht nur bei laufenden Projekten
+    if _active[0] is not None:
+        _cached_now[0] = time.monotonic()
+        update_project_display()
     root.after(1000, update_timer)  # Alle 1000ms (1 Sekunde) wiederholen
 
+# === Verarbeitung der Arduino-Nachrichten ===
+# Jeder Handler erhält den Text nach ": " und liefert
+# (uid_text, project_text, pname, action); None bedeutet "unverändert".
+def _handle_rfid(payload):
+    """Verarbeitet "RFID erkannt: UID" - Neue RFID-Karte erkannt."""
+    return "UID: " + payload, None, None, None
+
+def _handle_started(payload):
+    """Verarbeitet "Projekt gestartet: Name" - Projekt wurde gestartet."""
+    return None, "Projektname: " + clean_project_name(payload), payload, "gestartet"
+
+def _handle_paused(payload):
+    """Verarbeitet "Projekt pausiert: Name" - Projekt wurde pausiert."""
+    return None, "Projektname: " + clean_project_name(payload), payload, "pausiert"
+
+def _handle_deleted(payload):
+    """Verarbeitet "Projekt geloescht: Name (Zeit)" - Projekt wurde gelöscht."""
+    # Entferne die Zeitangabe in Klammern am Ende (z.B. " (0h 5m 23s)")
+    pname = payload.partition(" (")[0]
+    return None, "Projektname: (gelöscht)", pname, "geloescht"
+
+def _handle_added(payload):
+    """Verarbeitet "Projekt hinzugefügt: Name" - Neues Projekt hinzugefügt."""
+    return None, "Projektname: " + clean_project_name(payload), payload, "hinzugefügt"
+
+def _handle_unknown(payload):
+    """Verarbeitet "Unbekannte UID: UID" - Unbekannte RFID-Karte."""
+    return "UID: " + payload, "Projektname: (neu)", None, None
+
+# Nachrichtentyp (Text vor ": ") -> Handler
+_HANDLERS = {
+    "RFID erkannt": _handle_rfid,
+    "Projekt gestartet": _handle_started,
+    "Projekt pausiert": _handle_paused,
+    "Projekt geloescht": _handle_deleted,
+    "Projekt hinzugefügt": _handle_added,
+    "Unbekannte UID": _handle_unknown,
+}
+
+def _flush_output():
+    """
+    Schreibt alle wartenden seriellen Zeilen gesammelt in die Ausgabe-Textbox.
+    
+    Wird per root.after_idle() im Tk-Thread ausgeführt, sodass bei schnell
+    hintereinander eintreffenden Zeilen die Textbox nur einmal geändert wird.
+    """
+    _flush_scheduled[0] = False
+    lines = []
+    while _pending:
+        lines.append(_pending.popleft())
+    if not lines:
+        return
+    
+    _ob_configure(state='normal')
+    _ob_insert(tk.END, "\n".join(lines) + "\n")
+    _out_lines[0] += len(lines)
+    if _out_lines[0] > MAX_LINES:
+        # Älteste Zeilen entfernen, damit die Textbox nicht unbegrenzt wächst
+        _ob_delete("1.0", f"{_out_lines[0] - MAX_LINES + 1}.0")
+        _out_lines[0] = MAX_LINES
+    _ob_configure(state='disabled')
+    _ob_see(tk.END)
+
+def _apply_serial_line(uid_text, project_text, pname, action):
+    """
+    Überträgt eine verarbeitete serielle Zeile in die GUI (läuft im Tk-Thread).
+    
+    Args:
+        uid_text (str | None): Neuer Text für das UID-Label
+        project_text (str | None): Neuer Text für das Projekt-Label
+        pname (str | None): Projektname für add_or_update_project
+        action (str | None): Projektaktion oder None
+    """
+    # Zugehörige Zeile(n) zuerst ausgeben, da root.after()-Callbacks vor
+    # root.after_idle() laufen
+    _flush_output()
+    if uid_text is not None:
+        _uid_var.set(uid_text)
+    if project_text is not None:
+        _project_var.set(project_text)
+    if action is not None:
+        add_or_update_project(pname, action)
+
 # === Serielle Kommunikation ===
 def read_serial():
     """
@@ -322,73 +477,45 @@ def read_serial():
     - "Projekt hinzugefügt: Name" - Neues Projekt hinzugefügt
     - "Unbekannte UID: UID" - Unbekannte RFID-Karte
     
-    Alle GUI-Updates erfolgen thread-sicher über root.after().
+    Alle GUI-Updates erfolgen thread-sicher über root.after() bzw.
+    root.after_idle() für die gesammelte Textausgabe.
     """
     global ser
     buffer = ""
 
-    while running:
-        if ser and ser.in_waiting:
-            try:
-                line = ser.readline().decode('utf-8', errors='ignore').strip()
-                if not line:  # Leere Zeile überspringen
-                    continue
-                    
-                buffer += line + "\n"
-
-                # GUI-Ausgabe (Thread-sicher)
-                def update_output():
-                    output_box.configure(state='normal')
-                    output_box.insert(tk.END, line + "\n")
-                    output_box.configure(state='disabled')
-                    output_box.see(tk.END)
+    while running and ser:
+        # readline() blockiert bis Zeilenende oder Timeout (1s), kein Polling nötig
+        try:
+            raw = ser.readline().strip()
+            if not raw:  # Leere Zeile bzw. Timeout überspringen (ohne Dekodierung)
+                continue
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if not line:  # Nur ungültige Bytes (z.B. Rauschen beim Arduino-Start)
+                continue
                 
-                root.after(0, update_output)
-
-                # UID und Projektname erkennen
-                if "RFID erkannt:" in line:
-                    uid = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    root.after(0, lambda: uid_label.config(text="UID: " + uid))
-                    
-                elif "Projekt gestartet:" in line:
-                    pname = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    clean_name = clean_project_name(pname)
-                    root.after(0, lambda p=clean_name: project_label.config(text="Projektname: " + p))
-                    root.after(0, lambda p=pname: add_or_update_project(p, "gestartet"))
-                    
-                elif "Projekt pausiert:" in line:
-                    pname = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    clean_name = clean_project_name(pname)
-                    root.after(0, lambda p=clean_name: project_label.config(text="Projektname: " + p))
-                    root.after(0, lambda p=pname: add_or_update_project(p, "pausiert"))
-                    
-                elif "Projekt geloescht:" in line:
-                    # Extrahiere nur den Projektnamen vor der Zeitangabe in Klammern
-                    content = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    # Entferne die Zeitangabe in Klammern am Ende (z.B. " (0h 5m 23s)")
-                    if " (" in content:
-                        pname = content.split(" (")[0]
-                    else:
-                        pname = content
-                    
-                    root.after(0, lambda: project_label.config(text="Projektname: (gelöscht)"))
-                    root.after(0, lambda p=pname: add_or_update_project(p, "geloescht"))
-                    
-                elif "Projekt hinzugefügt:" in line:
-                    pname = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    clean_name = clean_project_name(pname)
-                    root.after(0, lambda p=clean_name: project_label.config(text="Projektname: " + p))
-                    root.after(0, lambda p=pname: add_or_update_project(p, "hinzugefügt"))
-                    
-                elif "Unbekannte UID:" in line:
-                    uid = line.split(": ", 1)[1] if ": " in line else "Unbekannt"
-                    root.after(0, lambda u=uid: uid_label.config(text="UID: " + u))
-                    root.after(0, lambda: project_label.config(text="Projektname: (neu)"))
-                    
-            except Exception as e:
-                print(f"Fehler beim Lesen der seriellen Daten: {e}")
-        
-        time.sleep(0.1)  # Kurze Pause um CPU-Last zu reduzieren
+            buffer += line + "\n"
+            
+            # Zeile für die gesammelte Ausgabe vormerken
+            _pending.append(line)
+            if not _flush_scheduled[0]:
+                _flush_scheduled[0] = True
+                root.after_idle(_flush_output)
+
+            # UID und Projektname erkennen
+            head, sep, payload = line.partition(": ")
+            if not sep:
+                head, payload = head.rstrip(":"), "Unbekannt"
+            handler = _HANDLERS.get(head)
+            if handler is not None:
+                # Übrige GUI-Updates einer Zeile in einem einzigen Callback (Thread-sicher)
+                root.after(0, functools.partial(_apply_serial_line, *handler(payload)))
+                
+        except (serial.SerialException, OSError) as e:
+            # Verbindung verloren (z.B. USB getrennt): Thread beenden statt endlos zu wiederholen
+            print(f"Serielle Verbindung unterbrochen: {e}")
+            break
+        except Exception as e:
+            print(f"Fehler beim Lesen der seriellen Daten: {e}")
 
 # === Setup COM-Port ===
 try: